@@ -1,6 +1,6 @@
 import turtle
 import datetime
-import time
+import math
 
 # Configuration parameters for scalability
 SCREEN_WIDTH = 600
@@ -37,67 +37,85 @@ def draw_clock_face(t, radius):
     t.pendown()
     t.pensize(2)
     t.circle(radius)
+    t.penup()
 
-    # Draw hour ticks
+    # Draw hour ticks: precompute each tick's endpoints and emit one canvas
+    # line per tick, skipping the goto/setheading/forward state machine.
+    # Tk's y axis points down, so y is negated.
+    canvas = screen.getcanvas()
     for i in range(12):
-        t.penup()
-        t.goto(0, 0)
-        t.setheading(90 - i * 30)
-        t.forward(radius - 20)
-        t.pendown()
-        t.forward(10)
-        t.penup()
+        angle = math.radians(90 - i * 30)
+        cos_a, sin_a = math.cos(angle), math.sin(angle)
+        canvas.create_line(
+            cos_a * (radius - 20), -sin_a * (radius - 20),
+            cos_a * (radius - 10), -sin_a * (radius - 10),
+            fill=CLOCK_COLOR, width=2,
+        )
+
+# Canvas item IDs for each hand's line and label, created on the first tick
+# and then moved in place with coords()/itemconfigure() instead of redrawn
+hand_items = {}
 
-# Function to draw a numeric hand
-def draw_hand(t, length, angle, color, label):
+# Function to draw or move a numeric hand
+def draw_hand(name, length, angle, color, label):
     """
-    Draws a single hand on the clock.
+    Draws a single hand on the clock, reusing its cached canvas items.
     Args:
-        t (turtle.Turtle): The turtle instance used for drawing.
+        name (str): Key identifying the hand ("hour", "minute" or "second").
         length (int): Length of the hand.
         angle (float): Angle of rotation for the hand.
         color (str): Color of the hand.
         label (str/int): Label to display at the tip of the hand.
     """
-    t.penup()
-    t.goto(0, 0)
-    t.color(color)
-    t.setheading(90 - angle)
-    t.forward(length - 20)
-    t.write(label, align="center", font=("Courier", 12, "bold"))
+    rad = math.radians(90 - angle)
+    # Tk's y axis points down, so y is negated
+    x = math.cos(rad) * (length - 20)
+    y = -math.sin(rad) * (length - 20)
+    canvas = screen.getcanvas()
+    if name not in hand_items:
+        line_id = canvas.create_line(0, 0, x, y, fill=color, width=2)
+        label_id = canvas.create_text(x, y - 10, text=str(label), fill=color, font=("Courier", 12, "bold"))
+        hand_items[name] = (line_id, label_id)
+    else:
+        line_id, label_id = hand_items[name]
+        canvas.coords(line_id, 0, 0, x, y)
+        canvas.coords(label_id, x, y - 10)
+        canvas.itemconfigure(label_id, text=str(label))
+
+# The minute last drawn, so the hour/minute hands are only moved when it changes
+last_drawn_minute = None
 
 # Function to update the clock hands dynamically
-def update_clock():
+def tick():
     """
-    Updates the clock hands dynamically to reflect the current time.
+    Moves the clock hands to the current time, then schedules itself to run
+    again in one second via the Tk event loop (no blocking sleep). Only the
+    second hand moves every tick; the hour and minute hands move once per
+    minute (the hour hand drifts with the minute).
     """
-    hand_turtle = turtle.Turtle()
-    hand_turtle.hideturtle()
-    hand_turtle.speed(0)
-
-    while True:
-        try:
-            hand_turtle.clear()
-            now = datetime.datetime.now()
-            hour = now.hour 
-            minute = now.minute
-            second = now.second
+    global last_drawn_minute
+    try:
+        now = datetime.datetime.now()
+        hour = now.hour
+        minute = now.minute
+        second = now.second
 
-            # Calculate angles
-            hour_angle = (hour + minute / 60) * 30  # Each hour is 30 degrees
-            minute_angle = minute * 6               # Each minute is 6 degrees
-            second_angle = second * 6               # Each second is 6 degrees
+        # Calculate angles
+        hour_angle = (hour + minute / 60) * 30  # Each hour is 30 degrees
+        minute_angle = minute * 6               # Each minute is 6 degrees
+        second_angle = second * 6               # Each second is 6 degrees
 
-            # Draw hands
-            draw_hand(hand_turtle, HOUR_HAND_LENGTH, hour_angle, "cyan", hour if hour != 0 else 12)  # Hour hand
-            draw_hand(hand_turtle, MINUTE_HAND_LENGTH, minute_angle, "blue", minute)                # Minute hand
-            draw_hand(hand_turtle, SECOND_HAND_LENGTH, second_angle, "red", second)                 # Second hand
+        # Move hands - hour and minute only when the minute has changed
+        if minute != last_drawn_minute:
+            draw_hand("hour", HOUR_HAND_LENGTH, hour_angle, "cyan", hour if hour != 0 else 12)  # Hour hand
+            draw_hand("minute", MINUTE_HAND_LENGTH, minute_angle, "blue", minute)               # Minute hand
+            last_drawn_minute = minute
+        draw_hand("second", SECOND_HAND_LENGTH, second_angle, "red", second)                    # Second hand
 
-            screen.update()
-            time.sleep(1)
-        except Exception as e:
-            print(f"Error while updating clock: {e}")
-            break
+        screen.update()
+        screen.ontimer(tick, 1000)
+    except Exception as e:
+        print(f"Error while updating clock: {e}")
 
 # Main program
 def main():
@@ -107,7 +125,7 @@ def main():
     try:
         screen.tracer(0)
         draw_clock_face(clock_turtle, CLOCK_RADIUS)
-        update_clock()
+        tick()
     except Exception as e:
         print(f"Unexpected error: {e}")
     finally:
@@ -1,16 +1,53 @@
+import hashlib
+import hmac
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as PoolTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
 import streamlit as st
-from sqlalchemy import create_engine, Column, Integer, String, Date, Time, Text, Float, DateTime
+from sqlalchemy import create_engine, Column, Integer, String, Date, Time, Text, Float, DateTime, Index, event, update, select, bindparam, func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.pool import StaticPool
 import bcrypt
 from datetime import datetime, date
 
+# bcrypt work factor. Each +1 doubles the hashing time, so tune this per
+# deployment (see calibrate_cost) instead of relying on the library default.
+BCRYPT_COST = int(os.environ.get("BCRYPT_COST", "12"))
+
+# Secret for the per-session auth token. Random per process unless pinned via
+# the environment (set ERP_AUTH_SECRET to survive server restarts).
+_AUTH_SECRET = os.environ.get("ERP_AUTH_SECRET", "").encode("utf-8") or os.urandom(32)
+
 ###########################################
 # Database Setup and Models
 ###########################################
 
 # Create an SQLite engine. For production, you may want to use PostgreSQL/MySQL.
-engine = create_engine("sqlite:///erp.db", echo=False, connect_args={"check_same_thread": False})
+# StaticPool keeps one connection open for the life of the process instead of
+# re-opening erp.db on every Streamlit rerun.
+engine = create_engine(
+    "sqlite:///erp.db",
+    echo=False,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune SQLite once per connection: WAL lets readers run alongside writers,
+    NORMAL sync skips the per-transaction fsync that dominates write latency."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
 SessionLocal = sessionmaker(bind=engine)
 Base = declarative_base()
 
@@ -20,10 +57,10 @@ class User(Base):
     user_id = Column(Integer, primary_key=True, index=True)
     full_name = Column(String, nullable=False)
     phone_number = Column(String, nullable=False)
-    email = Column(String, unique=True, nullable=False)
+    email = Column(String, unique=True, nullable=False, index=True)
     aadhar_number = Column(String, unique=True, nullable=False)
     service_domain = Column(String)
-    role = Column(String, nullable=False)  # 'admin', 'manager', 'staff', or 'client'
+    role = Column(String, nullable=False, index=True)  # 'admin', 'manager', 'staff', or 'client'
     level_of_employment = Column(String)
     date_of_joining = Column(Date)
     salary = Column(Float)
@@ -33,9 +70,12 @@ class User(Base):
 # Attendance table.
 class Attendance(Base):
     __tablename__ = 'attendance'
+    # Unique composite index: serves the per-user "today's record" lookup and
+    # is the conflict target for the check-in/out UPSERT.
+    __table_args__ = (Index("uq_att_user_date", "user_id", "date", unique=True),)
     attendance_id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, nullable=False)
-    date = Column(Date, default=date.today())
+    user_id = Column(Integer, nullable=False, index=True)
+    date = Column(Date, default=date.today(), index=True)
     check_in = Column(Time)
     check_out = Column(Time)
 
@@ -43,40 +83,166 @@ class Attendance(Base):
 class ServiceTicket(Base):
     __tablename__ = 'service_tickets'
     ticket_id = Column(Integer, primary_key=True, index=True)
-    client_id = Column(Integer, nullable=False)
+    client_id = Column(Integer, nullable=False, index=True)
     service_type = Column(String, nullable=False)
     description = Column(Text, nullable=False)
-    assigned_to = Column(Integer)  # Assigned staff user ID (if any)
-    status = Column(String, default="Pending")
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    assigned_to = Column(Integer, index=True)  # Assigned staff user ID (if any)
+    status = Column(String, default="Pending", index=True)
+    # Server-side timestamps: SQLite fills these itself on fresh schemas, and
+    # a trigger (see init_db) keeps updated_at fresh since SQLite has no
+    # native ON UPDATE. The Python-side defaults remain as a fallback for
+    # pre-existing databases, where create_all cannot add the server default.
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=func.now())
+    updated_at = Column(DateTime, default=datetime.utcnow, server_default=func.now(), server_onupdate=func.now())
+
+@st.cache_resource
+def init_db():
+    """One-time schema setup, run once per server rather than per rerun.
+
+    Creates the tables, then migrates an already-existing erp.db: create_all
+    only creates missing tables, so indexes and the updated_at trigger are
+    built explicitly (CREATE ... IF NOT EXISTS).
+    """
+    Base.metadata.create_all(bind=engine)
+    for table in Base.metadata.tables.values():
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    with engine.connect() as conn:
+        # Backfill timestamps left NULL by rows written before the columns
+        # gained their defaults.
+        conn.exec_driver_sql("UPDATE service_tickets SET created_at=CURRENT_TIMESTAMP WHERE created_at IS NULL")
+        conn.exec_driver_sql("UPDATE service_tickets SET updated_at=created_at WHERE updated_at IS NULL")
+        # SQLite ignores server_onupdate, so keep updated_at current with a trigger.
+        conn.exec_driver_sql(
+            "CREATE TRIGGER IF NOT EXISTS ticket_upd AFTER UPDATE ON service_tickets "
+            "BEGIN UPDATE service_tickets SET updated_at=CURRENT_TIMESTAMP WHERE ticket_id=NEW.ticket_id; END"
+        )
+        conn.commit()
+    return True
+
+init_db()
+
+###########################################
+# Precompiled Statements
+###########################################
 
-# Create the database tables.
-Base.metadata.create_all(bind=engine)
+# Core select statements built once at import, so the hot paths skip per-call
+# query construction and fetch only the columns the UI actually uses.
+_SEL_USER_BY_EMAIL = select(User.user_id, User.full_name, User.role, User.password_hash).where(
+    User.email == bindparam("email")
+)
+_SEL_STAFF = select(User.user_id, User.full_name).where(User.role == "staff")
+_SEL_HASH_BY_ID = select(User.password_hash).where(User.user_id == bindparam("user_id"))
+_SEL_TICKETS = select(
+    ServiceTicket.ticket_id, ServiceTicket.client_id, ServiceTicket.service_type,
+    ServiceTicket.description, ServiceTicket.status,
+)
+_SEL_TICKETS_BY_CLIENT = select(
+    ServiceTicket.ticket_id, ServiceTicket.service_type, ServiceTicket.description, ServiceTicket.status
+).where(ServiceTicket.client_id == bindparam("client_id"))
+_SEL_ATTENDANCE_TODAY = select(Attendance).where(
+    Attendance.user_id == bindparam("user_id"), Attendance.date == bindparam("date")
+)
+# Single-statement check-in/out: inserts today's record, or on conflict with
+# the (user_id, date) unique index stamps check_out once. Two rapid clicks can
+# neither duplicate the row nor overwrite an existing check-out.
+_UPSERT_ATTENDANCE = sqlite_insert(Attendance).values(
+    user_id=bindparam("user_id"), date=bindparam("date"), check_in=bindparam("check_in")
+)
+_UPSERT_ATTENDANCE = _UPSERT_ATTENDANCE.on_conflict_do_update(
+    index_elements=["user_id", "date"],
+    set_={"check_out": _UPSERT_ATTENDANCE.excluded.check_in},
+    where=Attendance.check_out.is_(None),
+)
 
 ###########################################
 # Helper Functions
 ###########################################
 
-def get_db():
-    """Yields a database session."""
-    db = SessionLocal()
+@st.cache_resource
+def get_session_factory():
+    """Return the process-wide scoped session factory (built once per server)."""
+    return scoped_session(SessionLocal)
+
+# bcrypt is pure CPU work, so run it in worker processes to sidestep the GIL
+# and keep the Streamlit script-runner thread responsive. The worker functions
+# must live at module level so they are picklable.
+def _do_hash(password: bytes, cost: int) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=cost))
+
+def _do_verify(password: bytes, hashed: bytes) -> bool:
+    return bcrypt.checkpw(password, hashed)
+
+def _do_hash_with_salt(args):
+    password, salt = args
+    return bcrypt.hashpw(password.encode('utf-8'), salt)
+
+@st.cache_resource
+def get_bcrypt_pool():
+    """Return the process-wide bcrypt worker pool (built once per server)."""
+    return ProcessPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) - 1))
+
+@st.cache_resource
+def get_dummy_hash() -> str:
+    """Constant hash verified when an email lookup misses, so a failed login
+    takes the same time whether or not the account exists (no timing-based
+    user enumeration). Computed once per server, not per rerun."""
+    return bcrypt.hashpw(b"dummy", bcrypt.gensalt(rounds=BCRYPT_COST)).decode('utf-8')
+
+def _pool_call(fn, *args):
+    """Run fn in the bcrypt pool, falling back in-process only if the pool broke."""
     try:
-        yield db
-    finally:
-        db.close()
+        future = get_bcrypt_pool().submit(fn, *args)
+    except BrokenProcessPool:
+        return fn(*args)
+    try:
+        return future.result(timeout=5)
+    except PoolTimeoutError:
+        # Pool saturated: the submitted hash is still queued or running, so
+        # wait for that future rather than hashing the same input twice.
+        return future.result()
+    except BrokenProcessPool:
+        return fn(*args)
 
 def hash_password(password: str) -> str:
     """Hash a plaintext password using bcrypt."""
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return _pool_call(_do_hash, password.encode('utf-8'), BCRYPT_COST).decode('utf-8')
 
 def verify_password(password: str, hashed: str) -> bool:
     """Verify a plaintext password against the hashed version."""
-    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    return _pool_call(_do_verify, password.encode('utf-8'), hashed.encode('utf-8'))
+
+def calibrate_cost(target_ms: int = 250) -> int:
+    """Return the largest bcrypt cost whose hashing time stays under target_ms.
+
+    Run this once on the deployment hardware and set the result via the
+    BCRYPT_COST environment variable.
+    """
+    cost = 4  # bcrypt's minimum
+    while True:
+        start = time.perf_counter()
+        bcrypt.hashpw(b"calibration", bcrypt.gensalt(rounds=cost + 1))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms > target_ms or cost + 1 >= 31:
+            return cost
+        cost += 1
+
+def get_hash_cost(hashed: str) -> int:
+    """Read the cost factor stored in a bcrypt hash ($2b$NN$...)."""
+    return int(hashed[4:6])
+
+def make_auth_token(user_id: int, password_hash: str) -> str:
+    """HMAC token proving a bcrypt verification already happened this session."""
+    return hmac.new(_AUTH_SECRET, f"{user_id}:{password_hash[:29]}".encode("utf-8"), hashlib.sha256).hexdigest()
+
+def check_auth_token(user_id: int, password_hash: str) -> bool:
+    """Re-verify the logged-in user with a constant-time compare, not bcrypt."""
+    token = st.session_state.get("auth_token")
+    return token is not None and hmac.compare_digest(token, make_auth_token(user_id, password_hash))
 
 def get_user_by_email(db, email: str):
-    """Retrieve a user by email."""
-    return db.query(User).filter(User.email == email).first()
+    """Retrieve a user's (user_id, full_name, role, password_hash) row by email."""
+    return db.execute(_SEL_USER_BY_EMAIL, {"email": email}).first()
 
 def create_user(db, user_data):
     """Create a new user record in the database."""
@@ -98,10 +264,49 @@ def create_user(db, user_data):
     db.refresh(new_user)
     return new_user
 
+def create_users_bulk(db, user_data_list):
+    """Create many users at once.
+
+    Passwords are hashed concurrently across the process pool and the rows go
+    in as one multi-row INSERT, so bootstrapping N users costs N/cores bcrypt
+    calls and a single commit instead of N sequential hash+INSERT round-trips.
+    """
+    salts = [bcrypt.gensalt(rounds=BCRYPT_COST) for _ in user_data_list]
+    hashes = list(get_bcrypt_pool().map(_do_hash_with_salt, [(d["password"], s) for d, s in zip(user_data_list, salts)]))
+    rows = [
+        {
+            "full_name": d["full_name"],
+            "phone_number": d["phone_number"],
+            "email": d["email"],
+            "aadhar_number": d["aadhar_number"],
+            "service_domain": d.get("service_domain", ""),
+            "role": d["role"],
+            "level_of_employment": d.get("level_of_employment", ""),
+            "date_of_joining": d.get("date_of_joining", date.today()),
+            "salary": d.get("salary", 0.0),
+            "certifications": d.get("certifications", ""),
+            "password_hash": h.decode('utf-8'),
+        }
+        for d, h in zip(user_data_list, hashes)
+    ]
+    db.bulk_insert_mappings(User, rows)
+    db.commit()
+
 def authenticate_user(db, email: str, password: str):
     """Authenticate a user by email and password."""
     user = get_user_by_email(db, email)
-    if user and verify_password(password, user.password_hash):
+    # Always burn exactly one bcrypt verification, against a dummy hash when
+    # the email is unknown, so every login costs the same CPU time.
+    verified = verify_password(password, user.password_hash if user else get_dummy_hash())
+    if user is not None and verified:
+        # Transparently migrate hashes stored with a weaker cost now that we
+        # have the plaintext in hand.
+        if get_hash_cost(user.password_hash) < BCRYPT_COST:
+            db.execute(update(User).where(User.user_id == user.user_id).values(password_hash=hash_password(password)))
+            db.commit()
+            # Re-fetch so the caller (and the auth token derived from the
+            # hash) sees the upgraded hash, not the stale row.
+            user = get_user_by_email(db, email)
         return user
     return None
 
@@ -117,6 +322,7 @@ if "user" not in st.session_state:
 def logout():
     st.session_state.logged_in = False
     st.session_state.user = None
+    st.session_state.pop("auth_token", None)
     st.experimental_rerun()
 
 ###########################################
@@ -124,23 +330,27 @@ def logout():
 ###########################################
 
 def login_page():
+    # Already authenticated this session - never re-enter bcrypt on a rerun.
+    if st.session_state.logged_in:
+        return
     st.title("Login")
     email = st.text_input("Email")
     password = st.text_input("Password", type="password")
     if st.button("Login"):
-        db = next(get_db())
-        user = authenticate_user(db, email, password)
-        if user:
-            st.success("Logged in successfully!")
-            st.session_state.logged_in = True
-            st.session_state.user = {
-                "user_id": user.user_id,
-                "full_name": user.full_name,
-                "role": user.role
-            }
-            st.experimental_rerun()
-        else:
-            st.error("Invalid email or password")
+        with get_session_factory()() as db:
+            user = authenticate_user(db, email, password)
+            if user:
+                st.success("Logged in successfully!")
+                st.session_state.logged_in = True
+                st.session_state["auth_token"] = make_auth_token(user.user_id, user.password_hash)
+                st.session_state.user = {
+                    "user_id": user.user_id,
+                    "full_name": user.full_name,
+                    "role": user.role
+                }
+                st.experimental_rerun()
+            else:
+                st.error("Invalid email or password")
 
 ###########################################
 # Admin: Register New User
@@ -165,25 +375,26 @@ def register_user():
         if password != confirm_password:
             st.error("Passwords do not match!")
         else:
-            db = next(get_db())
-            if get_user_by_email(db, email):
-                st.error("A user with this email already exists!")
-            else:
-                user_data = {
-                    "full_name": full_name,
-                    "phone_number": phone_number,
-                    "email": email,
-                    "aadhar_number": aadhar_number,
-                    "service_domain": service_domain,
-                    "role": role,
-                    "level_of_employment": level_of_employment,
-                    "date_of_joining": date_of_joining,
-                    "salary": salary,
-                    "certifications": certifications,
-                    "password": password
-                }
-                create_user(db, user_data)
-                st.success("User registered successfully!")
+            with get_session_factory()() as db:
+                if get_user_by_email(db, email):
+                    st.error("A user with this email already exists!")
+                else:
+                    user_data = {
+                        "full_name": full_name,
+                        "phone_number": phone_number,
+                        "email": email,
+                        "aadhar_number": aadhar_number,
+                        "service_domain": service_domain,
+                        "role": role,
+                        "level_of_employment": level_of_employment,
+                        "date_of_joining": date_of_joining,
+                        "salary": salary,
+                        "certifications": certifications,
+                        "password": password
+                    }
+                    create_user(db, user_data)
+                    load_staff_options.clear()
+                    st.success("User registered successfully!")
 
 ###########################################
 # Staff: Attendance Module
@@ -191,34 +402,31 @@ def register_user():
 
 def staff_attendance():
     st.header("Attendance")
-    db = next(get_db())
     today = date.today()
     user_id = st.session_state.user["user_id"]
-    # Look for an existing attendance record for today.
-    attendance_record = db.query(Attendance).filter(Attendance.user_id == user_id, Attendance.date == today).first()
-    
-    if attendance_record is None:
-        if st.button("Check In"):
-            new_attendance = Attendance(
-                user_id=user_id,
-                date=today,
-                check_in=datetime.now().time()
-            )
-            db.add(new_attendance)
-            db.commit()
-            st.success("Checked in successfully!")
-            st.experimental_rerun()
-    else:
-        if attendance_record.check_out is None:
-            st.write(f"Checked in at: {attendance_record.check_in}")
-            if st.button("Check Out"):
-                attendance_record.check_out = datetime.now().time()
+    with get_session_factory()() as db:
+        # Look for an existing attendance record for today.
+        attendance_record = db.execute(_SEL_ATTENDANCE_TODAY, {"user_id": user_id, "date": today}).scalars().first()
+
+        # Check-in and check-out share one UPSERT round-trip: it inserts the
+        # day's record or, if it already exists, fills in the check-out time.
+        if attendance_record is None:
+            if st.button("Check In"):
+                db.execute(_UPSERT_ATTENDANCE, {"user_id": user_id, "date": today, "check_in": datetime.now().time()})
                 db.commit()
-                st.success("Checked out successfully!")
+                st.success("Checked in successfully!")
                 st.experimental_rerun()
         else:
-            st.write("You have already checked in and out for today.")
-            st.write(f"Check In: {attendance_record.check_in} | Check Out: {attendance_record.check_out}")
+            if attendance_record.check_out is None:
+                st.write(f"Checked in at: {attendance_record.check_in}")
+                if st.button("Check Out"):
+                    db.execute(_UPSERT_ATTENDANCE, {"user_id": user_id, "date": today, "check_in": datetime.now().time()})
+                    db.commit()
+                    st.success("Checked out successfully!")
+                    st.experimental_rerun()
+            else:
+                st.write("You have already checked in and out for today.")
+                st.write(f"Check In: {attendance_record.check_in} | Check Out: {attendance_record.check_out}")
 
 ###########################################
 # Client: Service Request Module
@@ -229,21 +437,22 @@ def client_service_request():
     service_type = st.selectbox("Service Type", ["Housekeeping", "Pantry", "Car Driver", "Data Entry", "Electrician", "Plumber", "Gardener"])
     description = st.text_area("Description")
     if st.button("Submit Request"):
-        db = next(get_db())
-        new_ticket = ServiceTicket(
-            client_id=st.session_state.user["user_id"],
-            service_type=service_type,
-            description=description,
-            status="Pending"
-        )
-        db.add(new_ticket)
-        db.commit()
+        with get_session_factory()() as db:
+            new_ticket = ServiceTicket(
+                client_id=st.session_state.user["user_id"],
+                service_type=service_type,
+                description=description,
+                status="Pending"
+            )
+            db.add(new_ticket)
+            db.commit()
+        load_all_tickets.clear()
         st.success("Service request submitted successfully!")
 
 def client_view_tickets():
     st.header("My Service Tickets")
-    db = next(get_db())
-    tickets = db.query(ServiceTicket).filter(ServiceTicket.client_id == st.session_state.user["user_id"]).all()
+    with get_session_factory()() as db:
+        tickets = db.execute(_SEL_TICKETS_BY_CLIENT, {"client_id": st.session_state.user["user_id"]}).all()
     if tickets:
         for ticket in tickets:
             st.write(f"**Ticket ID:** {ticket.ticket_id}")
@@ -258,30 +467,63 @@ def client_view_tickets():
 # Manager: Service Ticket Management
 ###########################################
 
+@st.cache_data(ttl=60)
+def load_staff_options():
+    """Staff roster as {label: user_id}, cached so the per-ticket loop hits a dict."""
+    with get_session_factory()() as db:
+        staff_list = db.execute(_SEL_STAFF).all()
+    return {f"{full_name} (ID: {user_id})": user_id for user_id, full_name in staff_list}
+
+@st.cache_data(ttl=5)
+def load_all_tickets():
+    """All tickets as plain tuples (Streamlit can hash/pickle those, unlike ORM rows)."""
+    with get_session_factory()() as db:
+        return [tuple(row) for row in db.execute(_SEL_TICKETS)]
+
 def manager_service_tickets():
     st.header("Manage Service Tickets")
-    db = next(get_db())
-    tickets = db.query(ServiceTicket).all()
+    tickets = load_all_tickets()
     if tickets:
-        for ticket in tickets:
-            st.write(f"**Ticket ID:** {ticket.ticket_id}")
-            st.write(f"**Client ID:** {ticket.client_id}")
-            st.write(f"**Service Type:** {ticket.service_type}")
-            st.write(f"**Description:** {ticket.description}")
-            st.write(f"**Status:** {ticket.status}")
+        # One cached roster lookup for the whole page instead of one query per ticket.
+        staff_options = load_staff_options()
+        selected = []
+        for ticket_id, client_id, service_type, description, status in tickets:
+            st.write(f"**Ticket ID:** {ticket_id}")
+            st.write(f"**Client ID:** {client_id}")
+            st.write(f"**Service Type:** {service_type}")
+            st.write(f"**Description:** {description}")
+            st.write(f"**Status:** {status}")
             # If the ticket is still pending, allow assignment.
-            if ticket.status == "Pending":
-                staff_list = db.query(User).filter(User.role=="staff").all()
-                staff_options = {f"{s.full_name} (ID: {s.user_id})": s.user_id for s in staff_list}
+            if status == "Pending":
+                if st.checkbox(f"Select Ticket {ticket_id}", key=f"select_{ticket_id}"):
+                    selected.append(ticket_id)
                 # Using a unique key for each selectbox.
-                selected_staff = st.selectbox(f"Assign Ticket {ticket.ticket_id} to:", options=list(staff_options.keys()), key=f"ticket_{ticket.ticket_id}")
-                if st.button(f"Assign Ticket {ticket.ticket_id}", key=f"assign_{ticket.ticket_id}"):
-                    ticket.assigned_to = staff_options[selected_staff]
-                    ticket.status = "In Progress"
-                    db.commit()
-                    st.success(f"Ticket {ticket.ticket_id} assigned to {selected_staff}!")
+                selected_staff = st.selectbox(f"Assign Ticket {ticket_id} to:", options=list(staff_options.keys()), key=f"ticket_{ticket_id}")
+                if st.button(f"Assign Ticket {ticket_id}", key=f"assign_{ticket_id}"):
+                    with get_session_factory()() as db:
+                        ticket = db.query(ServiceTicket).filter(ServiceTicket.ticket_id == ticket_id).first()
+                        ticket.assigned_to = staff_options[selected_staff]
+                        ticket.status = "In Progress"
+                        db.commit()
+                    load_all_tickets.clear()
+                    st.success(f"Ticket {ticket_id} assigned to {selected_staff}!")
                     st.experimental_rerun()
             st.write("---")
+        # Bulk path: one UPDATE and one commit for all selected tickets instead
+        # of a transaction (and fsync) per ticket.
+        if selected:
+            bulk_staff = st.selectbox("Assign selected tickets to:", options=list(staff_options.keys()), key="bulk_assign_staff")
+            if st.button(f"Assign {len(selected)} Selected Tickets"):
+                with get_session_factory()() as db:
+                    db.execute(
+                        update(ServiceTicket)
+                        .where(ServiceTicket.ticket_id.in_(selected))
+                        .values(assigned_to=staff_options[bulk_staff], status="In Progress")
+                    )
+                    db.commit()
+                load_all_tickets.clear()
+                st.success(f"{len(selected)} tickets assigned to {bulk_staff}!")
+                st.experimental_rerun()
     else:
         st.write("No service tickets available.")
 
@@ -291,23 +533,39 @@ def manager_service_tickets():
 
 def staff_assigned_tickets():
     st.header("My Assigned Tickets")
-    db = next(get_db())
-    tickets = db.query(ServiceTicket).filter(ServiceTicket.assigned_to == st.session_state.user["user_id"]).all()
-    if tickets:
-        for ticket in tickets:
-            st.write(f"**Ticket ID:** {ticket.ticket_id}")
-            st.write(f"**Service Type:** {ticket.service_type}")
-            st.write(f"**Description:** {ticket.description}")
-            st.write(f"**Status:** {ticket.status}")
-            if ticket.status != "Completed":
-                if st.button(f"Mark Ticket {ticket.ticket_id} as Completed", key=f"complete_{ticket.ticket_id}"):
-                    ticket.status = "Completed"
+    with get_session_factory()() as db:
+        tickets = db.query(ServiceTicket).filter(ServiceTicket.assigned_to == st.session_state.user["user_id"]).all()
+        if tickets:
+            selected = []
+            for ticket in tickets:
+                st.write(f"**Ticket ID:** {ticket.ticket_id}")
+                st.write(f"**Service Type:** {ticket.service_type}")
+                st.write(f"**Description:** {ticket.description}")
+                st.write(f"**Status:** {ticket.status}")
+                if ticket.status != "Completed":
+                    if st.checkbox(f"Select Ticket {ticket.ticket_id}", key=f"select_done_{ticket.ticket_id}"):
+                        selected.append(ticket.ticket_id)
+                    if st.button(f"Mark Ticket {ticket.ticket_id} as Completed", key=f"complete_{ticket.ticket_id}"):
+                        ticket.status = "Completed"
+                        db.commit()
+                        load_all_tickets.clear()
+                        st.success(f"Ticket {ticket.ticket_id} marked as Completed!")
+                        st.experimental_rerun()
+                st.write("---")
+            # Bulk path: complete all selected tickets with one UPDATE and one commit.
+            if selected:
+                if st.button(f"Mark {len(selected)} Selected Tickets as Completed"):
+                    db.execute(
+                        update(ServiceTicket)
+                        .where(ServiceTicket.ticket_id.in_(selected))
+                        .values(status="Completed")
+                    )
                     db.commit()
-                    st.success(f"Ticket {ticket.ticket_id} marked as Completed!")
+                    load_all_tickets.clear()
+                    st.success(f"{len(selected)} tickets marked as Completed!")
                     st.experimental_rerun()
-            st.write("---")
-    else:
-        st.write("No tickets assigned to you.")
+        else:
+            st.write("No tickets assigned to you.")
 
 ###########################################
 # Admin/Manager: Attendance Report
@@ -315,11 +573,11 @@ def staff_assigned_tickets():
 
 def attendance_report():
     st.header("Attendance Report")
-    db = next(get_db())
     start_date = st.date_input("Start Date", date.today())
     end_date = st.date_input("End Date", date.today())
     if st.button("Generate Report"):
-        records = db.query(Attendance).filter(Attendance.date.between(start_date, end_date)).all()
+        with get_session_factory()() as db:
+            records = db.query(Attendance).filter(Attendance.date.between(start_date, end_date)).all()
         if records:
             for rec in records:
                 st.write(f"**User ID:** {rec.user_id} | **Date:** {rec.date} | **Check In:** {rec.check_in} | **Check Out:** {rec.check_out}")
@@ -331,6 +589,17 @@ def attendance_report():
 ###########################################
 
 def dashboard():
+    # Defensive re-auth before rendering any role-gated page: check the
+    # session token against the stored hash with a constant-time compare
+    # (no bcrypt). A stale token - e.g. after a server-side password change
+    # or a deleted account - logs the session out.
+    user_id = st.session_state.user["user_id"]
+    with get_session_factory()() as db:
+        stored_hash = db.execute(_SEL_HASH_BY_ID, {"user_id": user_id}).scalar()
+    if stored_hash is None or not check_auth_token(user_id, stored_hash):
+        logout()
+        return
+
     st.sidebar.title("Menu")
     role = st.session_state.user["role"]
 
@@ -392,17 +661,12 @@ def main():
 if __name__ == "__main__":
     main()
 
+###########################################
+# One-time Bootstrap Seeder
+###########################################
 
-
-from datetime import date
-from sqlalchemy.orm import sessionmaker
-from main import engine, User, create_user  # Adjust the import if your file/module name is different
-
-SessionLocal = sessionmaker(bind=engine)
-db = SessionLocal()
-
-# Define the admin user data.
-user_data = {
+# Default admin user data.
+DEFAULT_ADMIN = {
     "full_name": "Admin User",
     "phone_number": "1234567890",
     "email": "admin@example.com",
@@ -416,9 +680,14 @@ user_data = {
     "password": "adminpassword"  # Use a secure password in production!
 }
 
-# Create the admin user.
-create_user(db, user_data)
-print("Admin user created. You can now log in using admin@example.com and password adminpassword.")
-
+def seed_users(user_data_list=None):
+    """Bootstrap accounts in bulk (defaults to the single admin user).
 
-pip install streamlit sqlalchemy bcrypt
+    Run once with `python -c "import erp; erp.seed_users()"` before first login.
+    """
+    db = SessionLocal()
+    try:
+        create_users_bulk(db, user_data_list or [DEFAULT_ADMIN])
+    finally:
+        db.close()
+    print("Admin user created. You can now log in using admin@example.com and password adminpassword.")